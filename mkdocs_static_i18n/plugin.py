@@ -9,6 +9,7 @@ from mkdocs.config.config_options import Type
 from mkdocs.plugins import BasePlugin
 from mkdocs.structure.nav import get_navigation
 
+from mkdocs_static_i18n import struct
 from mkdocs_static_i18n.struct import I18nFile
 
 from .struct import I18nFiles, Locale
@@ -244,6 +245,7 @@ class I18n(BasePlugin):
         Construct the main + lang specific file tree which will be used to
         generate the navigation for the default site and per language.
         """
+        struct._DIR_CACHE.clear()
         main_files = I18nFiles([])
         main_files.default_locale = self.default_language
         main_files.locale = self.default_language
@@ -312,10 +314,8 @@ class I18n(BasePlugin):
         for i18n_page in files.documentation_pages():
             if Path(i18n_page.src_path).suffixes == [f".{language}", ".md"]:
                 config_path_expects = [
-                    i18n_page.non_i18n_src_path.with_suffix(".md"),
-                    i18n_page.non_i18n_src_path.with_suffix(
-                        f".{self.default_language}.md"
-                    ),
+                    f"{i18n_page.non_i18n_src_path}.md",
+                    f"{i18n_page.non_i18n_src_path}.{self.default_language}.md",
                 ]
                 for config_path in config_path_expects:
                     self.i18n_configs[language]["nav"] = self._list_replace_value(
@@ -1,6 +1,5 @@
 import os
 from pathlib import Path
-from re import compile
 from urllib.parse import quote as urlquote
 
 from mkdocs import utils
@@ -8,7 +7,31 @@ from mkdocs.config.base import ValidationError
 from mkdocs.config.config_options import Type
 from mkdocs.structure.files import File, Files
 
-RE_LOCALE = compile(r"(^[a-z]{2}_[A-Z]{2}$)|(^[a-z]{2}$)")
+# Characters that urllib.parse.quote leaves untouched (with its default
+# safe="/"): URLs made of those only can skip the quoting round trip.
+_URL_SAFE_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-~/"
+
+# Cache of the directory listings used to check for the existence of
+# localized file candidates. Since every candidate of a given file lives
+# in the same directory, one readdir per directory replaces up to three
+# stat calls per constructed I18nFile. Invalidated on every 'on_files'
+# plugin event to stay fresh when serving with live reload.
+_DIR_CACHE = {}
+
+
+def _dir_entries(directory):
+    """
+    Return the cached set of file names present in the given directory.
+    """
+    try:
+        return _DIR_CACHE[directory]
+    except KeyError:
+        try:
+            entries = frozenset(os.listdir(directory))
+        except OSError:
+            entries = frozenset()
+        _DIR_CACHE[directory] = entries
+        return entries
 
 
 class Locale(Type):
@@ -18,8 +41,25 @@ class Locale(Type):
     Validate the locale config option against a given Python type.
     """
 
+    @staticmethod
+    def _is_valid_locale(value):
+        """
+        Expect either a two letter 'xx' language code or its five
+        character 'xx_XX' territory variant, validated with cheap string
+        checks instead of a regex.
+        """
+        if len(value) == 2:
+            return all("a" <= char <= "z" for char in value)
+        if len(value) == 5:
+            return (
+                value[2] == "_"
+                and all("a" <= char <= "z" for char in value[:2])
+                and all("A" <= char <= "Z" for char in value[3:])
+            )
+        return False
+
     def _validate_locale(self, value):
-        if not RE_LOCALE.match(value):
+        if not self._is_valid_locale(value):
             raise ValidationError(
                 "Language code values must be either ISO-639-1 lower case "
                 "or represented with they territory/region/county codes, "
@@ -49,6 +89,14 @@ class I18nFiles(Files):
     locale = None
     translated = False
 
+    def __init__(self, files):
+        super().__init__(files)
+        # O(1) src_path lookup index, maintained by append/remove since
+        # the parent 'src_paths' property rebuilds its dict on every access
+        self._src_path_index = {os.path.normpath(file.src_path): file for file in files}
+        self._dest_paths = {file.dest_path for file in files}
+        self._locale_infixes = None
+
     def append(self, file):
         """
         Since i18nFile find their own language versions, we need to avoid adding
@@ -56,10 +104,46 @@ class I18nFiles(Files):
 
         The first i18nFile is sufficient to cover all their possible localized versions.
         """
-        for inside_file in [*self._files]:
-            if inside_file.dest_path == file.dest_path:
-                return
+        if file.dest_path in self._dest_paths:
+            return
+        self._dest_paths.add(file.dest_path)
         self._files.append(file)
+        self._src_path_index[os.path.normpath(file.src_path)] = file
+
+    def remove(self, file):
+        """ Remove file from Files collection. """
+        super().remove(file)
+        self._src_path_index.pop(os.path.normpath(file.src_path), None)
+        self._dest_paths.discard(file.dest_path)
+
+    @property
+    def src_paths(self):
+        """
+        Expose the normalized src_path index instead of letting the
+        parent property rebuild its dict on every access.
+        """
+        return self._src_path_index
+
+    def _get_expected_src_paths(self, path):
+        """
+        Return the localized, default language localized and provided
+        versions of the given path, in that lookup priority order.
+        """
+        infixes = self._locale_infixes
+        if infixes is None:
+            # the locale attributes are assigned by the plugin right
+            # after construction, so cache their infix form on first use
+            infixes = self._locale_infixes = (
+                f".{self.locale}",
+                f".{self.default_locale}",
+            )
+        path = os.path.normpath(path)
+        root, suffix = os.path.splitext(path)
+        return (
+            root + infixes[0] + suffix,
+            root + infixes[1] + suffix,
+            path,
+        )
 
     def __contains__(self, path):
         """
@@ -70,28 +154,17 @@ class I18nFiles(Files):
         mkdocs.structure.pages / path_to_url() method to point to the localized
         version of the file, if present.
         """
-        expected_src_path = Path(path)
-        expected_src_paths = [
-            expected_src_path.with_suffix(f".{self.locale}{expected_src_path.suffix}"),
-            expected_src_path.with_suffix(
-                f".{self.default_locale}{expected_src_path.suffix}"
-            ),
-            expected_src_path,
-        ]
-        return any(filter(lambda s: Path(s) in expected_src_paths, self.src_paths))
+        return any(
+            src_path in self._src_path_index
+            for src_path in self._get_expected_src_paths(path)
+        )
 
     def get_file_from_path(self, path):
         """ Return a File instance with File.src_path equal to path. """
-        expected_src_path = Path(path)
-        expected_src_paths = [
-            expected_src_path.with_suffix(f".{self.locale}{expected_src_path.suffix}"),
-            expected_src_path.with_suffix(
-                f".{self.default_locale}{expected_src_path.suffix}"
-            ),
-            expected_src_path,
-        ]
-        for src_path in filter(lambda s: Path(s) in expected_src_paths, self.src_paths):
-            return self.src_paths.get(os.path.normpath(src_path))
+        for src_path in self._get_expected_src_paths(path):
+            file = self._src_path_index.get(src_path)
+            if file is not None:
+                return file
 
 
 class I18nFile(File):
@@ -124,41 +197,45 @@ class I18nFile(File):
         self.initial_src_path = file_from.src_path
         self.locale_suffix = None
 
+        # parse the initial src_path suffixes once, they are needed
+        # repeatedly in the constructor and its helpers
+        self.suffix = os.path.splitext(self.initial_src_path)[1]
+        self._suffixes = tuple(Path(self.initial_src_path).suffixes)
+        self._localized_for = self._is_localized_for()
+        non_i18n_src_path = os.path.splitext(self.initial_src_path)[0]
+        if self._localized_for:
+            non_i18n_src_path = os.path.splitext(non_i18n_src_path)[0]
+        self._non_i18n_src_path = non_i18n_src_path
+
         # the name without any suffix
         self.name = self._get_stem()
 
-        # find src_path
-        expected_paths = [
-            (
-                language,
-                Path(docs_dir)
-                / Path(f"{self.non_i18n_src_path}.{language}{self.suffix}"),
-            ),
-            (
-                default_language,
-                Path(docs_dir)
-                / Path(f"{self.non_i18n_src_path}.{default_language}{self.suffix}"),
-            ),
-            (None, Path(docs_dir) / Path(f"{self.non_i18n_src_path}{self.suffix}")),
-        ]
-        for locale_suffix, expected_path in expected_paths:
-            if Path(expected_path).exists():
-                self.src_path = expected_path.relative_to(self.docs_dir)
-                self.abs_src_path = Path(self.docs_dir) / Path(self.src_path)
+        # find src_path, stopping at the first candidate found so fully
+        # translated sites only ever build the localized candidate
+        parent_dir, name_root = os.path.split(os.path.join(docs_dir, non_i18n_src_path))
+        dir_entries = _dir_entries(parent_dir)
+        src_path_start = len(docs_dir) + 1
+        for locale_suffix in (language, default_language, None):
+            if locale_suffix is None:
+                expected_name = f"{name_root}{self.suffix}"
+            else:
+                expected_name = f"{name_root}.{locale_suffix}{self.suffix}"
+            if expected_name in dir_entries:
+                expected_path = os.path.join(parent_dir, expected_name)
+                self.src_path = expected_path[src_path_start:]
+                self.abs_src_path = expected_path
                 #
                 self.locale_suffix = locale_suffix
                 if self.locale_suffix:
-                    self.dest_name = Path(self.name).with_suffix(self.suffix)
+                    self.dest_name = os.path.splitext(self.name)[0] + self.suffix
                 else:
-                    self.dest_name = Path(self.name).with_suffix(
-                        "".join(Path(self.initial_src_path).suffixes)
+                    self.dest_name = os.path.splitext(self.name)[0] + "".join(
+                        self._suffixes
                     )
                 #
                 self.dest_path = self._get_dest_path(use_directory_urls)
-                self.abs_dest_path = (
-                    Path(self.site_dir)
-                    / Path(self.dest_language)
-                    / Path(self.dest_path)
+                self.abs_dest_path = os.path.join(
+                    self.site_dir, self.dest_language, self.dest_path
                 )
                 break
         else:
@@ -171,12 +248,6 @@ class I18nFile(File):
         # set url
         self.url = self._get_url(use_directory_urls)
 
-        # mkdocs expects strings for those
-        self.abs_dest_path = str(self.abs_dest_path)
-        self.abs_src_path = str(self.abs_src_path)
-        self.dest_path = str(self.dest_path)
-        self.src_path = str(self.src_path)
-
     def __repr__(self):
         return (
             f"I18nFile(src_path='{self.src_path}', abs_src_path='{self.abs_src_path}',"
@@ -191,35 +262,24 @@ class I18nFile(File):
         """
         Return the path of the given page without any suffix.
         """
-        if self._is_localized_for() is None:
-            non_i18n_src_path = Path(self.initial_src_path).with_suffix("")
-        else:
-            non_i18n_src_path = (
-                Path(self.initial_src_path).with_suffix("").with_suffix("")
-            )
-        return non_i18n_src_path
+        return self._non_i18n_src_path
 
     def _is_localized_for(self):
         """
         Returns the locale detected in the file's suffixes <name>.<locale>.<suffix>.
         """
+        suffixes = {suffix[1:] for suffix in self._suffixes}
+        if not suffixes:
+            return None
         for language in self.all_languages:
-            expected_suffixes = [f".{language}", Path(self.initial_src_path).suffix]
-            if set(expected_suffixes) <= set(Path(self.initial_src_path).suffixes):
+            if language in suffixes:
                 return language
         return None
 
-    @property
-    def suffix(self):
-        return Path(self.initial_src_path).suffix
-
     def _get_stem(self):
         """ Return the name of the file without it's extension. """
-        return (
-            "index"
-            if self.non_i18n_src_path.name in ("index", "README")
-            else self.non_i18n_src_path.name
-        )
+        name = os.path.basename(self._non_i18n_src_path)
+        return "index" if name in ("index", "README") else name
 
     def _get_dest_path(self, use_directory_urls):
         """ Return destination path based on source path. """
@@ -237,7 +297,9 @@ class I18nFile(File):
 
     def _get_url(self, use_directory_urls):
         """ Return url based in destination path. """
-        url = str(self.dest_path).replace(os.path.sep, "/")
+        url = self.dest_path
+        if os.path.sep != "/":
+            url = url.replace(os.path.sep, "/")
         dirname, filename = os.path.split(url)
         if use_directory_urls and filename == "index.html":
             if dirname == "":
@@ -249,13 +311,15 @@ class I18nFile(File):
                 url = self.dest_language + "/"
             else:
                 url = self.dest_language + "/" + url
+        # rstrip consumes the whole url when every character is safe,
+        # which lets the common ASCII case skip urlquote entirely
+        if not url.rstrip(_URL_SAFE_CHARS):
+            return url
         return urlquote(url)
 
     def url_relative_to(self, other):
         """ Return url for file relative to other i18n file. """
         return utils.get_relative_url(
             self.url,
-            other.url
-            if (isinstance(other, File) or isinstance(other, I18nFile))
-            else other,
+            other.url if isinstance(other, File) else other,
         )